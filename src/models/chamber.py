@@ -16,7 +16,8 @@ from utils.helpers import (
     calculate_fluid_density,
     calculate_fluid_viscosity,
     calculate_discharge_coefficient,
-    generate_radial_pattern
+    generate_radial_pattern,
+    squared_distances
 )
 
 class FCCChamber:
@@ -39,6 +40,14 @@ class FCCChamber:
         self.fluid_density = calculate_fluid_density(self.pressure, self.inlet_temp)
         self.fluid_viscosity = calculate_fluid_viscosity(self.inlet_temp)
 
+        # Cached unit conversions and geometry constants (m / m²), used on
+        # the pressure-drop and hole-lookup hot paths
+        self._hole_dia_m = self.hole_diameter / 1000
+        self._hole_radius_m = self.hole_diameter / 2000
+        self._inlet_radius_m = self.inlet_diameter / 2000
+        self._single_hole_area = np.pi * self._hole_radius_m ** 2
+        self._inlet_area = np.pi * self._inlet_radius_m ** 2
+
         # Turbulence parameters
         self.k_epsilon = 0.01
         self.turbulent_intensity = 0.1
@@ -73,50 +82,42 @@ class FCCChamber:
         return grid_states
 
     def get_grid_coordinates(self, grid_idx):
-        """Get coordinates of holes for a specific grid"""
+        """Get hole coordinates for a grid as a contiguous (H, 3) array"""
         num_holes = self.grid_holes[grid_idx]
-        coordinates = generate_radial_pattern(num_holes, self.pattern_radius)
-        
-        # Convert to list of tuples and add z-coordinate
+        coordinates = np.asarray(
+            generate_radial_pattern(num_holes, self.pattern_radius))
+
+        # Add z-coordinate; float32 keeps mm-level geometry in half the bytes
         z_pos = self.grid_positions[grid_idx] * self.chamber_height
-        return [(x, y, z_pos) for x, y in coordinates]
+        return np.column_stack([
+            coordinates,
+            np.full(len(coordinates), z_pos)
+        ]).astype(np.float32)
 
     def calculate_grid_flow_areas(self):
         """Calculate flow areas for each grid considering plugging"""
-        hole_areas = []
-        for state in self.grid_states:
-            # Only consider open holes for flow area
-            single_hole_area = np.pi * (self.hole_diameter / 2000) ** 2  # Convert to m²
-            total_area = state['open_holes'] * single_hole_area
-            hole_areas.append(total_area)
-        return hole_areas
+        # Only consider open holes for flow area
+        open_holes = np.array([s['open_holes'] for s in self.grid_states])
+        return open_holes * self._single_hole_area
 
     def calculate_pressure_drop(self):
         """Calculate pressure drop across grids"""
         areas = self.calculate_grid_flow_areas()
-        pressure_drops = []
 
-        inlet_area = np.pi * (self.inlet_diameter / 2000) ** 2  # Convert to m²
-        for area in areas:
-            # Calculate velocity through open holes
-            velocity = self.inlet_velocity * inlet_area / area
-            
-            # Calculate Reynolds number
-            Re = (
-                self.fluid_density
-                * velocity
-                * (self.hole_diameter / 1000)  # Use hole diameter for Re
-                / self.fluid_viscosity
-            )
-            
-            # Get discharge coefficient
-            cd = calculate_discharge_coefficient(Re)
-            
-            # Calculate pressure drop
-            dp = 0.5 * self.fluid_density * (velocity**2) * (1 - cd**2)
-            pressure_drops.append(dp)
+        # Velocity through open holes of every grid at once
+        velocities = self.inlet_velocity * self._inlet_area / areas
+
+        # Reynolds numbers (use hole diameter for Re)
+        Re = (
+            self.fluid_density
+            * velocities
+            * self._hole_dia_m
+            / self.fluid_viscosity
+        )
 
-        return pressure_drops
+        # Discharge coefficients and pressure drops as one ufunc expression
+        cd = calculate_discharge_coefficient(Re)
+        return 0.5 * self.fluid_density * velocities**2 * (1 - cd**2)
 
     def get_plugging_statistics(self):
         """Get statistics about grid plugging"""
@@ -135,13 +136,15 @@ class FCCChamber:
 
     def check_hole_status(self, position):
         """Check if a given position corresponds to a plugged hole"""
+        position = np.asarray(position, dtype=np.float64)
+        threshold_sq = self._hole_dia_m**2  # hole diameter in m for comparison
         for grid_idx, state in enumerate(self.grid_states):
-            for idx, hole_pos in enumerate(state['hole_positions']):
-                # Check if position is near this hole
-                distance = np.sqrt(sum((p1 - p2)**2 for p1, p2 in zip(position, hole_pos)))
-                if distance < self.hole_diameter/1000:  # Convert mm to m for comparison
-                    # Determine if hole is plugged
-                    total_open = state['open_holes']
-                    if idx >= total_open:
-                        return True, grid_idx
+            # Squared distance to every hole of this grid in one pass;
+            # any in-threshold hole in the plugged tail (indices past
+            # open_holes) counts, not just the closest one
+            d2 = squared_distances(state['hole_positions'], position)
+            hit = ((d2 < threshold_sq) &
+                   (np.arange(d2.size) >= state['open_holes']))
+            if hit.any():
+                return True, grid_idx
         return False, None
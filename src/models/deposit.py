@@ -3,12 +3,55 @@ from dataclasses import dataclass
 from typing import List, Tuple
 import logging  # Add this import
 from src.utils.constants import DEPOSIT_PROPERTIES, GRID_1_PLUGGING
+from src.utils.helpers import squared_distances
+from src.utils.jit import njit, prange, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Shared generator; `choice(..., shuffle=False)` avoids the full
+# permutation the legacy np.random.choice performs
+_rng = np.random.default_rng()
+
+# 15mm impact effect radius
+IMPACT_RADIUS = 0.015
+
+# Edge length of the spatial-hash cells used to tile the impact scan.
+# Twice the impact radius guarantees that a cell plus its 1-ring
+# neighbours covers every deposit a particle can reach.
+_CELL_SIZE = 2 * IMPACT_RADIUS
+
+@njit('i8(f8[:,:], u1[:], f8[:], f8[:], f8, f8, f8, f8, f8, f8, f8)',
+      parallel=True, fastmath=True, cache=True)
+def _impact_kernel(pos, removed, strength, thickness, px, py, pz,
+                   impact_energy, impact_radius, moisture_factor,
+                   base_thickness):
+    """Scan all deposits for removal by a single particle impact.
+
+    Mutates `removed` in place and returns the number of deposits
+    removed by this impact. The eager signature plus cache=True compiles
+    once at import and persists the machine code across runs, so the
+    first check_impact call never pays lazy-specialization warmup.
+    """
+    n_removed = 0
+    for i in prange(pos.shape[0]):
+        if removed[i] != 0:
+            continue
+        dx = pos[i, 0] - px
+        dy = pos[i, 1] - py
+        dz = pos[i, 2] - pz
+        d = np.sqrt(dx*dx + dy*dy + dz*dz)
+        if d < impact_radius:
+            local_energy = impact_energy * (1 - d/impact_radius)
+            threshold = (strength[i] * (thickness[i]/base_thickness)
+                         / moisture_factor)
+            if local_energy > threshold:
+                removed[i] = 1
+                n_removed += 1
+    return n_removed
+
 @dataclass
 class DepositPoint:
-    position: Tuple[float, float, float]
+    position: np.ndarray
     thickness: float
     strength: float
     removed: bool = False
@@ -17,9 +60,36 @@ class DepositModel:
     def __init__(self, chamber):
         logger.debug("Initializing DepositModel")
         self.chamber = chamber
-        self.deposits: List[DepositPoint] = []
+        # SoA buffers for the hot impact scan (positions (N,3) in meters,
+        # thickness, strength and removed flags as parallel arrays)
+        self.pos = np.empty((0, 3), dtype=np.float64)
+        self.thickness = np.empty(0, dtype=np.float64)
+        self.strength = np.empty(0, dtype=np.float64)
+        self.removed = np.zeros(0, dtype=np.uint8)
+        # Bumped whenever deposits are added or removed; lets consumers
+        # cache derived statistics until the state actually changes
+        self.version = 0
         self.initialize_deposits()
-        
+
+    @property
+    def deposits(self) -> List[DepositPoint]:
+        """Materialize DepositPoint objects on demand for external callers"""
+        return [
+            DepositPoint(
+                position=p,
+                thickness=float(t),
+                strength=float(s),
+                removed=bool(r)
+            )
+            for p, t, s, r in zip(self.pos, self.thickness,
+                                  self.strength, self.removed)
+        ]
+
+    @property
+    def removed_mask(self) -> np.ndarray:
+        """Boolean view over the uint8 removed flags for mask indexing"""
+        return self.removed.view(np.bool_)
+
     def initialize_deposits(self):
         """Initialize deposit distribution based on inspection data"""
         logger.debug("Starting deposit initialization")
@@ -29,95 +99,221 @@ class DepositModel:
                 hole_positions = grid_state['hole_positions']
                 num_plugged = grid_state['plugged_deposit']
                 logger.debug(f"Initializing {num_plugged} deposits for grid {grid_idx}")
-                
+
                 # Select random holes for plugging based on actual data
-                plugged_indices = np.random.choice(
-                    len(hole_positions), 
-                    size=num_plugged, 
-                    replace=False
+                plugged_indices = _rng.choice(
+                    len(hole_positions),
+                    size=num_plugged,
+                    replace=False,
+                    shuffle=False
                 )
-                
-                for idx in plugged_indices:
-                    x, y, z = hole_positions[idx]
-                    self.add_deposit_cluster(x, y, z)
-
-        logger.info(f"Deposit initialization complete. Total deposits: {len(self.deposits)}")
-    
-    def add_deposit_cluster(self, x: float, y: float, z: float):
-        """Add a cluster of deposit points around a location"""
-        num_points = np.random.randint(5, 15)
+
+                # Pre-sample all cluster sizes and build every cluster in
+                # one allocation instead of growing buffers per cluster.
+                # Hole coordinates are chamber geometry in mm; deposits
+                # live in meters so impact checks compare like units
+                # with particle positions.
+                cluster_sizes = _rng.integers(5, 15, size=num_plugged)
+                centers = np.asarray(
+                    hole_positions, dtype=np.float64)[plugged_indices] / 1000
+
+                positions, thicknesses, strengths = self._generate_clusters(
+                    centers, cluster_sizes)
+
+                self.pos = positions
+                self.thickness = thicknesses
+                self.strength = strengths
+                self.removed = np.zeros(len(thicknesses), dtype=np.uint8)
+                self.version += 1
+
+        self._build_cells()
+        logger.info(f"Deposit initialization complete. Total deposits: {len(self.thickness)}")
+
+    def _build_cells(self):
+        """Bucket deposit indices into a coarse spatial grid.
+
+        The impact scan then only streams the deposits in the particle's
+        cell and its 1-ring neighbours instead of the whole buffer.
+        """
+        keys = np.floor(self.pos / _CELL_SIZE).astype(np.int64)
+        cells = {}
+        for i, key in enumerate(map(tuple, keys)):
+            cells.setdefault(key, []).append(i)
+        self._cells = {key: np.asarray(idx) for key, idx in cells.items()}
+
+    def _candidate_indices(self, position: np.ndarray) -> np.ndarray:
+        """Indices of deposits in the cells reachable from a position"""
+        cx, cy, cz = np.floor(position / _CELL_SIZE).astype(np.int64)
+        chunks = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    idx = self._cells.get((cx + dx, cy + dy, cz + dz))
+                    if idx is not None:
+                        chunks.append(idx)
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(chunks)
+
+    def _generate_clusters(self, centers, cluster_sizes):
+        """Generate SoA deposit buffers for clusters around the given centers"""
+        total = int(cluster_sizes.sum())
         radius = 0.025  # 25mm cluster radius
-        
-        for _ in range(num_points):
-            # Random position within cluster
-            dx = np.random.normal(0, radius/3)
-            dy = np.random.normal(0, radius/3)
-            dz = np.random.normal(0, radius/3)
-            
-            # Random thickness and strength based on fouling analysis
-            thickness = np.random.uniform(*DEPOSIT_PROPERTIES['thickness_range'])
-            
-            # Adjust strength based on composition
-            base_strength = DEPOSIT_PROPERTIES['adhesion_strength']
-            strength_variation = base_strength * 0.1  # 10% variation
-            
-            # Higher strength where there's more silica content
-            silica_factor = 1.0 + DEPOSIT_PROPERTIES['silica_content']
-            strength = np.random.normal(
-                base_strength * silica_factor,
-                strength_variation
-            )
-            
-            self.deposits.append(DepositPoint(
-                position=(x + dx, y + dy, z + dz),
-                thickness=thickness,
-                strength=strength
-            ))
-    
-    def check_impact(self, particle_position: Tuple[float, float, float], 
+
+        # Broadcast cluster centers over their points, then perturb
+        positions = (np.repeat(centers, cluster_sizes, axis=0) +
+                     _rng.normal(0, radius/3, size=(total, 3)))
+
+        # Random thickness and strength based on fouling analysis
+        thicknesses = _rng.uniform(
+            *DEPOSIT_PROPERTIES['thickness_range'], size=total)
+
+        # Adjust strength based on composition
+        base_strength = DEPOSIT_PROPERTIES['adhesion_strength']
+        strength_variation = base_strength * 0.1  # 10% variation
+
+        # Higher strength where there's more silica content
+        silica_factor = 1.0 + DEPOSIT_PROPERTIES['silica_content']
+        strengths = _rng.normal(
+            base_strength * silica_factor,
+            strength_variation,
+            size=total
+        )
+
+        return positions, thicknesses, strengths
+
+    def add_deposit_cluster(self, x: float, y: float, z: float,
+                            num_points: int = None):
+        """Add a cluster of deposit points around a location (meters)"""
+        if num_points is None:
+            num_points = int(_rng.integers(5, 15))
+
+        positions, thicknesses, strengths = self._generate_clusters(
+            np.array([[x, y, z]], dtype=np.float64),
+            np.array([num_points])
+        )
+
+        self.pos = np.concatenate([self.pos, positions])
+        self.thickness = np.concatenate([self.thickness, thicknesses])
+        self.strength = np.concatenate([self.strength, strengths])
+        self.removed = np.concatenate(
+            [self.removed, np.zeros(num_points, dtype=np.uint8)])
+        self.version += 1
+        self._build_cells()
+
+    def check_impact(self, particle_position: Tuple[float, float, float],
                     particle_velocity: Tuple[float, float, float],
                     particle_mass: float) -> bool:
         """Check if particle impact removes deposit"""
         # Calculate impact energy
-        impact_energy = 0.5 * particle_mass * sum(v**2 for v in particle_velocity)
-        impact_radius = 0.015  # 15mm impact effect radius
-        
-        deposits_removed = False
-        for deposit in self.deposits:
-            if deposit.removed:
-                continue
-                
-            # Calculate distance to deposit
-            dist = np.sqrt(sum((p1 - p2)**2 for p1, p2 in 
-                             zip(particle_position, deposit.position)))
-            
-            if dist < impact_radius:
-                # Impact energy decreases with distance
-                local_energy = impact_energy * (1 - dist/impact_radius)
-                
-                # Consider deposit properties in removal calculation
-                # Higher moisture content makes removal easier
-                moisture_factor = 1.0 + DEPOSIT_PROPERTIES['moisture']
-                
-                # Thicker deposits are harder to remove
-                thickness_factor = deposit.thickness / DEPOSIT_PROPERTIES['thickness_range'][0]
-                
-                removal_threshold = deposit.strength * thickness_factor / moisture_factor
-                
-                if local_energy > removal_threshold:
-                    deposit.removed = True
-                    deposits_removed = True
-        
-        return deposits_removed
-    
+        position = np.asarray(particle_position, dtype=np.float64)
+        velocity = np.asarray(particle_velocity, dtype=np.float64)
+        impact_energy = 0.5 * particle_mass * velocity.dot(velocity)
+
+        # Higher moisture content makes removal easier
+        moisture_factor = 1.0 + DEPOSIT_PROPERTIES['moisture']
+
+        # Only scan the deposits in the particle's spatial-hash tile
+        tile = self._candidate_indices(position)
+        if tile.size == 0:
+            return False
+
+        if NUMBA_AVAILABLE:
+            removed_tile = np.ascontiguousarray(self.removed[tile])
+            n_removed = _impact_kernel(
+                np.ascontiguousarray(self.pos[tile]),
+                removed_tile,
+                np.ascontiguousarray(self.strength[tile]),
+                np.ascontiguousarray(self.thickness[tile]),
+                position[0], position[1], position[2],
+                impact_energy, IMPACT_RADIUS, moisture_factor,
+                DEPOSIT_PROPERTIES['thickness_range'][0]
+            )
+            if n_removed > 0:
+                self.removed[tile] = removed_tile
+                self.version += 1
+                return True
+            return False
+
+        # Squared distances to the tile's deposits in one vectorized pass
+        d2 = squared_distances(self.pos[tile], position)
+        candidates = ~self.removed_mask[tile] & (d2 < IMPACT_RADIUS**2)
+
+        if not candidates.any():
+            return False
+
+        # Impact energy decreases with distance
+        dist = np.sqrt(d2[candidates])
+        local_energy = impact_energy * (1 - dist/IMPACT_RADIUS)
+
+        # Thicker deposits are harder to remove
+        thickness_factor = (self.thickness[tile][candidates] /
+                            DEPOSIT_PROPERTIES['thickness_range'][0])
+
+        removal_threshold = (self.strength[tile][candidates]
+                             * thickness_factor / moisture_factor)
+
+        newly_removed = local_energy > removal_threshold
+        if not newly_removed.any():
+            return False
+
+        self.removed[tile[candidates][newly_removed]] = 1
+        self.version += 1
+        return True
+
+    def check_impacts(self, particle_positions: np.ndarray,
+                      particle_velocities: np.ndarray,
+                      particle_masses: np.ndarray) -> np.ndarray:
+        """Check a batch of particle impacts against all deposits at once.
+
+        Broadcasts a (P, N) distance matrix instead of P separate
+        check_impact calls. Returns a (P,) boolean array flagging which
+        particles removed at least one deposit.
+        """
+        positions = np.asarray(particle_positions, dtype=np.float64)
+        velocities = np.asarray(particle_velocities, dtype=np.float64)
+        masses = np.asarray(particle_masses, dtype=np.float64)
+
+        moisture_factor = 1.0 + DEPOSIT_PROPERTIES['moisture']
+
+        # Kinetic energy per particle
+        energies = 0.5 * masses * np.einsum('ij,ij->i', velocities, velocities)
+
+        # (P, N) squared distances in one broadcast kernel
+        diff = self.pos[None, :, :] - positions[:, None, :]
+        d2 = np.einsum('pnd,pnd->pn', diff, diff)
+
+        candidates = (d2 < IMPACT_RADIUS**2) & ~self.removed_mask[None, :]
+        if not candidates.any():
+            return np.zeros(len(positions), dtype=np.bool_)
+
+        # Impact energy decreases with distance
+        local_energy = energies[:, None] * (1 - np.sqrt(d2)/IMPACT_RADIUS)
+
+        # Per-deposit removal threshold (same model as check_impact)
+        thresholds = (self.strength
+                      * (self.thickness/DEPOSIT_PROPERTIES['thickness_range'][0])
+                      / moisture_factor)
+
+        removals = candidates & (local_energy > thresholds[None, :])
+
+        # Collapse over particles so simultaneous hits on one deposit
+        # update self.removed exactly once
+        newly_removed = removals.any(axis=0)
+        if newly_removed.any():
+            self.removed[newly_removed] = 1
+            self.version += 1
+
+        return removals.any(axis=1)
+
     def get_deposit_stats(self):
         """Get statistics about deposit removal"""
-        total_deposits = len(self.deposits)
-        removed_deposits = sum(1 for d in self.deposits if d.removed)
-        
+        total_deposits = self.removed.size
+        removed_deposits = int(self.removed.sum())
+
         return {
             'total_deposits': total_deposits,
             'removed_deposits': removed_deposits,
-            'removal_percentage': (removed_deposits / total_deposits * 100 
+            'removal_percentage': (removed_deposits / total_deposits * 100
                                  if total_deposits > 0 else 0)
         }
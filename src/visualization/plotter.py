@@ -1,10 +1,7 @@
 import os
+import shutil
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-import matplotlib.animation as animation
-from matplotlib.colors import LinearSegmentedColormap
-import matplotlib.patches as mpatches
+from src.visualization._kernels import compact_deposits
 from src.utils.constants import (
     FIGURE_SIZE,
     DPI,
@@ -15,55 +12,209 @@ from src.utils.constants import (
     CHAMBER_ALPHA,
 )
 
+# Optional GPU-rendered animation backend
+try:
+    from vispy import app as vispy_app, scene as vispy_scene
+    VISPY_AVAILABLE = True
+except ImportError:
+    VISPY_AVAILABLE = False
+
+# matplotlib is imported lazily on the first Visualizer construction.
+# Pulling in pyplot/mplot3d/animation at module import costs up to a
+# second of cold start (font cache, backend probing) that batch
+# simulation runs importing this package never need to pay.
+plt = None
+animation = None
+Line3DCollection = None
+LinearSegmentedColormap = None
+ListedColormap = None
+
+
+def _load_matplotlib():
+    """Bind the matplotlib modules the plot paths use, on first need"""
+    global plt, animation, Line3DCollection
+    global LinearSegmentedColormap, ListedColormap
+    if plt is not None:
+        return
+    import matplotlib.pyplot as _plt
+    import matplotlib.animation as _animation
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection as _l3d
+    from matplotlib.colors import (LinearSegmentedColormap as _lsc,
+                                   ListedColormap as _lc)
+    plt, animation, Line3DCollection = _plt, _animation, _l3d
+    LinearSegmentedColormap, ListedColormap = _lsc, _lc
+
 
 class Visualizer:
     def __init__(self, chamber, particle_tracker):
+        _load_matplotlib()
         self.chamber = chamber
         self.particle_tracker = particle_tracker
         
-        # Create custom colormaps for deposits and impacts
-        self.deposit_cmap = LinearSegmentedColormap.from_list('deposit', 
+        # Create custom colormaps for deposits and impacts. The deposit
+        # map is resolved into a 256-entry RGBA LUT once; scatter colors
+        # are then plain integer lookups instead of segment
+        # interpolation, and the ListedColormap keeps cmap= callers
+        # working against the same table.
+        deposit_cmap = LinearSegmentedColormap.from_list('deposit',
             ['lightcoral', 'darkred'])
+        self._deposit_lut = deposit_cmap(np.linspace(0, 1, 256))
+        self.deposit_cmap = ListedColormap(self._deposit_lut, name='deposit')
         self.impact_cmap = LinearSegmentedColormap.from_list('impact',
             ['yellow', 'orange', 'red'])
 
+        # Chamber geometry is fixed for the life of the visualizer, so
+        # the wall meshgrid and grid-ring coordinates are computed once
+        # here instead of on every plot/animation call
+        self._r = chamber.grid_diameter / 2000  # Convert to meters
+        self._h = chamber.chamber_height / 1000
+        self._grid_z = np.asarray(chamber.grid_positions,
+                                  dtype=np.float64) * self._h
+        self._grid_1_height = self._grid_z[0]
+        self._xlim = (-self._r * 1.2, self._r * 1.2)
+        # 40x20 is visually indistinguishable from the old 100x100 at
+        # the wall's low alpha, but cuts the polygons mplot3d has to
+        # depth-sort from 10k to a few hundred
+        self._theta = np.linspace(0, 2*np.pi, 40)
+        self._cos_t = np.cos(self._theta)
+        self._sin_t = np.sin(self._theta)
+        self._ring_x = self._r * self._cos_t
+        self._ring_y = self._r * self._sin_t
+        # Grid rings as ready polylines; each plot call batches them
+        # into a single Line3DCollection (one artist to depth-sort)
+        # instead of one Line3D per grid
+        self._grid_rings = [
+            np.column_stack([self._ring_x, self._ring_y,
+                             np.full_like(self._ring_x, z)])
+            for z in self._grid_z
+        ]
+        theta_m, z_m = np.meshgrid(self._theta, np.linspace(0, self._h, 20))
+        self._wall_x = self._r * np.cos(theta_m)
+        self._wall_y = self._r * np.sin(theta_m)
+        self._wall_z = z_m
+        # Unit-circle template for the impact-wave ring; frames scale
+        # and translate it instead of rebuilding cos/sin arrays
+        wave_theta = np.linspace(0, 2*np.pi, 50)
+        self._unit_circle = np.stack(
+            [np.cos(wave_theta), np.sin(wave_theta)], axis=1)
+
+        # Deposit arrays in plot units, rebuilt only when the deposit
+        # model's version counter changes
+        self._deposit_cache = {'version': -1}
+
+        # Figure/axes/colorbar reused across plot_chamber_and_trajectory
+        # calls so repeated plotting (parameter sweeps) does not leak
+        # Axes or rebuild the colorbar layout every time
+        self._static_fig = None
+        self._static_ax = None
+        self._static_cbar = None
+        # Animation figure reused the same way; recreating a 3D axes
+        # per animate/save call is the expensive part of setup
+        self._anim_fig = None
+        self._anim_ax = None
+
+    def _deposit_arrays(self):
+        """Deposit positions (m), thicknesses and removed mask, cached.
+
+        Valid while ``deposit_model.version`` is unchanged; animation
+        frames therefore reuse the same arrays instead of rebuilding
+        them from Python-side object loops.
+        """
+        deposit_model = self.particle_tracker.deposit_model
+        if self._deposit_cache['version'] != deposit_model.version:
+            # float32 is plenty for screen coordinates and halves the
+            # bytes the draw path has to stream per frame
+            thickness = deposit_model.thickness.astype(np.float32)
+            if thickness.size:
+                # Mapping thickness straight through the LUT here means
+                # the animation hands matplotlib ready RGBA instead of
+                # re-normalizing the c array on every draw
+                tmin = thickness.min()
+                span = thickness.max() - tmin
+                if span > 0:
+                    idx = ((thickness - tmin) / span * 255).astype(np.int32)
+                else:
+                    idx = np.zeros(thickness.shape, dtype=np.int32)
+                rgba = self._deposit_lut[idx]
+            else:
+                rgba = np.empty((0, 4))
+            # Deposits are stored in meters, same as trajectories, so
+            # no unit conversion happens on the draw path. Coordinates
+            # go into SoA x/y/z arrays: _offsets3d wants three 1-D
+            # arrays anyway, and contiguous float32 columns halve the
+            # bytes streamed per scatter update versus (N,3) float64
+            pos = deposit_model.pos.astype(np.float32)
+            self._deposit_cache = {
+                'version': deposit_model.version,
+                'x': np.ascontiguousarray(pos[:, 0]),
+                'y': np.ascontiguousarray(pos[:, 1]),
+                'z': np.ascontiguousarray(pos[:, 2]),
+                'thickness': thickness,
+                'rgba': rgba,
+                'removed_mask': deposit_model.removed_mask.copy(),
+            }
+            # Output buffers for the compiled compaction kernel; sized
+            # once here so animation frames never allocate
+            n = thickness.size
+            self._act_x = np.empty(n, dtype=np.float32)
+            self._act_y = np.empty(n, dtype=np.float32)
+            self._act_z = np.empty(n, dtype=np.float32)
+            self._act_thick = np.empty(n, dtype=np.float32)
+            self._act_rgba = np.empty((n, 4))
+            self._rem_x = np.empty(n, dtype=np.float32)
+            self._rem_y = np.empty(n, dtype=np.float32)
+            self._rem_z = np.empty(n, dtype=np.float32)
+            self._rem_thick = np.empty(n, dtype=np.float32)
+            self._rem_rgba = np.empty((n, 4))
+        return self._deposit_cache
+
     def plot_chamber_and_trajectory(self, trajectory_data):
-        """Create static 3D visualization of chamber and trajectory"""
-        fig = plt.figure(figsize=(12, 10))
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Get dimensions
-        r = self.chamber.grid_diameter / 2000  # Convert to meters
-        h = self.chamber.chamber_height / 1000
-        grid_1_height = self.chamber.grid_positions[0] * h
-        
+        """Create static 3D visualization of chamber and trajectory.
+
+        The figure, axes and colorbar are created on the first call and
+        reused afterwards; repeat calls clear and redraw the axes and
+        refresh the existing colorbar instead of allocating new ones.
+        """
+        if (self._static_fig is not None
+                and plt.fignum_exists(self._static_fig.number)):
+            fig, ax = self._static_fig, self._static_ax
+            ax.clear()
+        else:
+            fig = plt.figure(figsize=(12, 10))
+            ax = fig.add_subplot(111, projection='3d')
+            self._static_fig, self._static_ax = fig, ax
+            self._static_cbar = None
+
         # Plot chamber outline
-        theta = np.linspace(0, 2*np.pi, 100)
-        z = np.linspace(0, h, 100)
-        theta, z = np.meshgrid(theta, z)
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        
-        ax.plot_surface(x, y, z, alpha=0.1, color='gray')
-        
-        # Plot grids
-        for height in self.chamber.grid_positions:
-            z_grid = height * h
-            x_grid = r * np.cos(theta[0])
-            y_grid = r * np.sin(theta[0])
-            ax.plot(x_grid, y_grid, [z_grid]*len(theta[0]), 
-                   color='blue', alpha=0.7, linewidth=2)
-        
+        ax.plot_wireframe(self._wall_x, self._wall_y, self._wall_z,
+                          rstride=2, cstride=4, color='gray',
+                          alpha=0.2, linewidth=0.5)
+
+        # Plot grids as one batched collection
+        ax.add_collection3d(Line3DCollection(
+            self._grid_rings, colors='blue', alpha=0.7, linewidths=2))
+
         # Plot deposits
-        deposits = self.particle_tracker.deposit_model.deposits
-        positions = np.array([d.position for d in deposits if not d.removed]) / 1000
-        thicknesses = np.array([d.thickness for d in deposits if not d.removed])
-        
-        if len(positions) > 0:
-            scatter = ax.scatter(positions[:, 0], positions[:, 1], positions[:, 2],
+        cache = self._deposit_arrays()
+        active = ~cache['removed_mask']
+        thicknesses = cache['thickness'][active]
+
+        if active.any():
+            scatter = ax.scatter(cache['x'][active], cache['y'][active],
+                             cache['z'][active],
                              c=thicknesses, cmap=self.deposit_cmap,
                              s=100, alpha=0.8, label='Deposits')
-            plt.colorbar(scatter, label='Deposit Thickness (m)')
+            # Vector backends would otherwise emit one primitive per
+            # deposit; rasterize the dense collection into the axes.
+            # mplot3d collections only honor this once their draw is
+            # wrapped with allow_rasterization, hence the guard.
+            if getattr(scatter.draw, '_supports_rasterization', False):
+                scatter.set_rasterized(True)
+            if self._static_cbar is None:
+                self._static_cbar = fig.colorbar(
+                    scatter, ax=ax, label='Deposit Thickness (m)')
+            else:
+                self._static_cbar.update_normal(scatter)
         
         # Plot particle trajectory
         ax.plot(trajectory_data[:, 0], trajectory_data[:, 1], trajectory_data[:, 2],
@@ -76,8 +227,8 @@ class Visualizer:
                   color='red', s=100, label='End')
         
         # Plot impacts
-        if self.particle_tracker.impacts:
-            impact_positions = np.array(self.particle_tracker.impacts)
+        if len(self.particle_tracker.impacts) > 0:
+            impact_positions = np.asarray(self.particle_tracker.impacts)
             ax.scatter(impact_positions[:, 0], impact_positions[:, 1], 
                       impact_positions[:, 2], color='yellow', marker='*',
                       s=200, label='Impacts')
@@ -89,10 +240,10 @@ class Visualizer:
         ax.set_title('FCC Chamber with Particle Trajectory and Deposits')
         
         # Set consistent view limits
-        ax.set_xlim(-r*1.2, r*1.2)
-        ax.set_ylim(-r*1.2, r*1.2)
-        ax.set_zlim(0, h)
-        
+        ax.set_xlim(*self._xlim)
+        ax.set_ylim(*self._xlim)
+        ax.set_zlim(0, self._h)
+
         # Set view angle
         ax.view_init(elev=20, azim=45)
         
@@ -102,281 +253,371 @@ class Visualizer:
         plt.show()
         return fig, ax     
 
-    def animate_trajectory(self, trajectory_data, interval=50):
-        """Enhanced animation with better particle-deposit interaction visualization"""
-        fig = plt.figure(figsize=(12, 10))
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Get dimensions
-        r = self.chamber.grid_diameter / 2000
-        h = self.chamber.chamber_height / 1000
-        grid_1_height = self.chamber.grid_positions[0] * h
-        
-        # Create static elements
-        theta = np.linspace(0, 2*np.pi, 100)
-        z = np.linspace(0, h, 100)
-        theta, z = np.meshgrid(theta, z)
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        
-        # Track removed deposits for visualization
-        self.removed_deposits = []
-        
+    def animate_trajectory(self, trajectory_data, interval=50, mode='detailed',
+                           target_seconds=15, animation_frames=None,
+                           disp_skip=1, show=True):
+        """Create animation with persistent artists.
+
+        The chamber wall, grid rings, labels and limits are drawn once;
+        each frame only mutates the data of artists created up front, so
+        the per-frame cost is the changed points rather than a full
+        scene redraw.
+
+        mode='detailed' adds removal fade-out, impact waves, a direction
+        arrow, an effectiveness meter and a slowly rotating camera.
+        mode='simple' keeps a fixed camera, which lets the animation
+        blit only the changed region instead of redrawing the figure.
+
+        Long trajectories are downsampled to at most the number of
+        frames a target_seconds playback can show at the given interval
+        (the trajectory line still draws the full prefix each frame, so
+        no samples are lost visually). animation_frames overrides the
+        computed frame budget directly, and disp_skip > 1 instead
+        renders every disp_skip-th sample with no duration cap, for
+        callers that want fidelity proportional to the simulation.
+
+        show=False skips plt.show() for headless callers such as
+        save_animation, which would otherwise render the animation once
+        on screen and a second time into the file.
+        """
+        detailed = mode == 'detailed'
+
+        # One rendered frame per simulation sample wastes >99% of the
+        # draw work once trajectories reach 1e4+ samples; either render
+        # every disp_skip-th sample, or cap frames at what the playback
+        # duration can actually show
+        if disp_skip > 1:
+            frame_indices = np.arange(0, len(trajectory_data), disp_skip)
+        else:
+            if animation_frames is None:
+                fps = 1000 / interval
+                animation_frames = int(fps * target_seconds)
+            max_frames = min(len(trajectory_data), animation_frames)
+            frame_indices = np.linspace(
+                0, len(trajectory_data) - 1, max_frames).astype(int)
+
+        if (self._anim_fig is not None
+                and plt.fignum_exists(self._anim_fig.number)):
+            fig, ax = self._anim_fig, self._anim_ax
+            ax.clear()
+        else:
+            fig = plt.figure(figsize=FIGURE_SIZE)
+            ax = fig.add_subplot(111, projection='3d')
+            self._anim_fig, self._anim_ax = fig, ax
+
+        grid_1_height = self._grid_1_height
+
+        # Static scene, drawn exactly once from the cached geometry
+        ax.plot_wireframe(self._wall_x, self._wall_y, self._wall_z,
+                          rstride=2, cstride=4, color='gray',
+                          alpha=0.2, linewidth=0.5)
+        ax.add_collection3d(Line3DCollection(
+            self._grid_rings, colors='blue', alpha=0.7, linewidths=2))
+
+        ax.set_xlabel('X (m)')
+        ax.set_ylabel('Y (m)')
+        ax.set_zlabel('Z (m)')
+        ax.set_title('FCC Chamber Cleaning Simulation')
+        ax.set_xlim(*self._xlim)
+        ax.set_ylim(*self._xlim)
+        ax.set_zlim(0, self._h)
+        ax.view_init(elev=20, azim=45)
+
+        # Persistent artists, created once and mutated per frame. A NaN
+        # point stands in for "hidden" so the collections never go empty.
+        # Blitting requires artists marked animated, but only works with
+        # the fixed camera of simple mode.
+        animated = not detailed
+        nan = np.array([np.nan])
+        hidden = (nan, nan, nan)
+        traj_line, = ax.plot([], [], [], color='black', linewidth=2,
+                             label='Trajectory', animated=animated)
+        particle = ax.scatter(*hidden, color='green', s=150,
+                              label='Particle', animated=animated)
+        impact = ax.scatter(*hidden, color='yellow', s=200, marker='*',
+                            label='Impact', alpha=0.8, animated=animated)
+        if detailed:
+            deposit_scatter = ax.scatter(*hidden, color='darkred',
+                                         s=100, alpha=0.8, label='Deposits')
+            removed_scatter = ax.scatter(*hidden, color='yellow', s=150,
+                                         alpha=0.3, marker='*',
+                                         label='Removed Deposits')
+            if getattr(deposit_scatter.draw, '_supports_rasterization', False):
+                deposit_scatter.set_rasterized(True)
+                removed_scatter.set_rasterized(True)
+            # Impact-wave ring drawn from the cached unit-circle
+            # template; the z row is constant at the grid height
+            wave_z = np.full(len(self._unit_circle), grid_1_height)
+            wave_line, = ax.plot([], [], [], color='yellow', alpha=0.3)
+            effectiveness_text = ax.text2D(
+                0.02, 0.98, '', transform=ax.transAxes, fontsize=10,
+                bbox=dict(facecolor='white', alpha=0.7))
+            # One persistent three-segment arrow (shaft + two head
+            # barbs); quiver would rebuild a whole collection per frame.
+            # add_collection3d needs at least one segment, so seed with
+            # an invisible NaN segment.
+            arrow = Line3DCollection([np.full((2, 3), np.nan)],
+                                     color='black', linewidths=1.5)
+            ax.add_collection3d(arrow)
+        else:
+            deposit_scatter = ax.scatter(*hidden, color='red', s=50,
+                                         alpha=0.8, label='Deposits',
+                                         animated=True)
+            if getattr(deposit_scatter.draw, '_supports_rasterization', False):
+                deposit_scatter.set_rasterized(True)
+        ax.legend(loc='upper right')
+
         def update(frame):
-            ax.cla()
-            
-            # Plot chamber
-            ax.plot_surface(x, y, z, alpha=0.1, color='gray')
-            
-            # Plot grids
-            for height in self.chamber.grid_positions:
-                z_grid = height * h
-                x_grid = r * np.cos(theta[0])
-                y_grid = r * np.sin(theta[0])
-                ax.plot(x_grid, y_grid, [z_grid]*len(theta[0]), 
-                       color='blue', alpha=0.7, linewidth=2)
-            
-            # Get current particle position
-            current_pos = trajectory_data[:frame+1]
-            
-            # Plot deposits with removal effect
-            deposits = self.particle_tracker.deposit_model.deposits
-            active_deposits = []
-            removed_deposits = []
-            
-            for d in deposits:
-                pos = np.array(d.position) / 1000  # Convert to meters
-                if d.removed:
-                    removed_deposits.append((pos, d.thickness))
+            """Update animation frame"""
+            # Deposits (version-cached arrays, no rebuild unless the
+            # deposit model actually changed)
+            cache = self._deposit_arrays()
+            removed_mask = cache['removed_mask']
+
+            # Compact the active set into persistent buffers with the
+            # compiled kernel: no per-frame fancy-index allocations
+            n_act = compact_deposits(
+                cache['x'], cache['y'], cache['z'],
+                cache['thickness'], cache['rgba'], removed_mask, False,
+                self._act_x, self._act_y, self._act_z,
+                self._act_thick, self._act_rgba)
+            if n_act:
+                deposit_scatter._offsets3d = (
+                    self._act_x[:n_act], self._act_y[:n_act],
+                    self._act_z[:n_act])
+                if detailed:
+                    # Precomputed RGBA skips the colormap remap per draw
+                    deposit_scatter.set_facecolors(self._act_rgba[:n_act])
+            else:
+                deposit_scatter._offsets3d = hidden
+
+            if detailed:
+                # Removed deposits keep their fade-out look
+                n_rem = compact_deposits(
+                    cache['x'], cache['y'], cache['z'],
+                    cache['thickness'], cache['rgba'], removed_mask, True,
+                    self._rem_x, self._rem_y, self._rem_z,
+                    self._rem_thick, self._rem_rgba)
+                if n_rem:
+                    removed_scatter._offsets3d = (
+                        self._rem_x[:n_rem], self._rem_y[:n_rem],
+                        self._rem_z[:n_rem])
                 else:
-                    active_deposits.append((pos, d.thickness))
-            
-            # Plot active deposits
-            if active_deposits:
-                positions, thicknesses = zip(*active_deposits)
-                positions = np.array(positions)
-                ax.scatter(positions[:, 0], positions[:, 1], positions[:, 2],
-                         c=thicknesses, cmap=self.deposit_cmap,
-                         s=100, alpha=0.8, label='Deposits')
-            
-            # Plot removed deposits with fade-out effect
-            if removed_deposits:
-                positions, _ = zip(*removed_deposits)
-                positions = np.array(positions)
-                ax.scatter(positions[:, 0], positions[:, 1], positions[:, 2],
-                         color='yellow', s=150, alpha=0.3, marker='*',
-                         label='Removed Deposits')
-            
-            # Plot particle trajectory
+                    removed_scatter._offsets3d = hidden
+
+
+            # Particle trajectory on the persistent line
+            current_pos = trajectory_data[:frame+1]
             if len(current_pos) > 0:
-                # Trajectory line
-                ax.plot(current_pos[:, 0], current_pos[:, 1], current_pos[:, 2],
-                       color='black', linewidth=2, label='Trajectory')
-                
+                traj_line.set_data_3d(
+                    current_pos[:, 0], current_pos[:, 1], current_pos[:, 2])
+
                 # Current particle position
                 pos = current_pos[-1]
                 if pos[2] > grid_1_height:
                     # Particle above grid
-                    ax.scatter(pos[0], pos[1], pos[2],
-                             color='green', s=150, label='Particle')
-                    
-                    # Add direction arrow
-                    if len(current_pos) > 1:
-                        direction = pos - current_pos[-2]
-                        ax.quiver(pos[0], pos[1], pos[2],
-                                direction[0], direction[1], direction[2],
-                                color='black', length=0.1, normalize=True)
-                else:
-                    # Show impact
-                    ax.scatter(pos[0], pos[1], grid_1_height,
-                             color='yellow', s=200, marker='*',
-                             label='Impact', alpha=0.8)
-                    
-                    # Add impact waves
-                    circle_theta = np.linspace(0, 2*np.pi, 50)
-                    wave_r = 0.1 * (frame % 20) / 20
-                    circle_x = pos[0] + wave_r * np.cos(circle_theta)
-                    circle_y = pos[1] + wave_r * np.sin(circle_theta)
-                    ax.plot(circle_x, circle_y, [grid_1_height]*50,
-                           color='yellow', alpha=0.3)
-            
-            # Set labels and limits
-            ax.set_xlabel('X (m)')
-            ax.set_ylabel('Y (m)')
-            ax.set_zlabel('Z (m)')
-            ax.set_title('FCC Chamber Cleaning Simulation')
-            
-            # Set consistent view limits
-            ax.set_xlim(-r*1.2, r*1.2)
-            ax.set_ylim(-r*1.2, r*1.2)
-            ax.set_zlim(0, h)
-            
-            # Rotate view for better perspective
-            ax.view_init(elev=20, azim=45 + frame/2)
-            
-            # Add legend
-            ax.legend(loc='upper right')
-            
-            # Add effectiveness meter
-            if len(self.particle_tracker.impacts) > 0:
-                removed_count = sum(1 for d in deposits if d.removed)
-                total_count = len(deposits)
-                effectiveness = removed_count / total_count * 100
-                ax.text2D(0.02, 0.98, f'Cleaning Effectiveness: {effectiveness:.1f}%',
-                         transform=ax.transAxes, fontsize=10,
-                         bbox=dict(facecolor='white', alpha=0.7))
-            
-            return ax,
-        
-        anim = animation.FuncAnimation(
-            fig, update,
-            frames=len(trajectory_data),
-            interval=interval,
-            blit=False,
-            repeat=True
-        )
-        
-        plt.show()
-        return fig, ax
-        
-    def animate_trajectory(self, trajectory_data, interval=50):
-        """Create animation with proper initialization and scaling"""
-        fig = plt.figure(figsize=FIGURE_SIZE)
-        ax = fig.add_subplot(111, projection='3d')
-        
-        # Get grid height and chamber dimensions
-        grid_1_height = self.chamber.grid_positions[0] * self.chamber.chamber_height/1000
-        r = self.chamber.grid_diameter / 2000  # Convert to meters
-        h = self.chamber.chamber_height / 1000  # Convert to meters
-        
-        # Create static elements
-        theta = np.linspace(0, 2*np.pi, 100)
-        z = np.linspace(0, h, 100)
-        theta, z = np.meshgrid(theta, z)
-        x = r * np.cos(theta)
-        y = r * np.sin(theta)
-        
-        def init():
-            """Initialize the animation"""
-            ax.cla()
-            # Plot chamber wall
-            ax.plot_surface(x, y, z, alpha=0.1, color='gray')
-            
-            # Plot grids
-            for height in self.chamber.grid_positions:
-                z_grid = height * h
-                x_grid = r * np.cos(theta[0])
-                y_grid = r * np.sin(theta[0])
-                ax.plot(x_grid, y_grid, [z_grid]*len(theta[0]), 
-                    color='blue', alpha=0.5)
-            
-            # Set initial view and limits
-            ax.set_xlim(-r*1.2, r*1.2)
-            ax.set_ylim(-r*1.2, r*1.2)
-            ax.set_zlim(0, h)
-            return ax,
-        
-        def update(frame):
-            """Update animation frame"""
-            ax.cla()
-            
-            # Plot chamber walls
-            ax.plot_surface(x, y, z, alpha=0.1, color='gray')
-            
-            # Plot grids
-            for height in self.chamber.grid_positions:
-                z_grid = height * h
-                x_grid = r * np.cos(theta[0])
-                y_grid = r * np.sin(theta[0])
-                ax.plot(x_grid, y_grid, [z_grid]*len(theta[0]), 
-                    color='blue', alpha=0.5)
-            
-            # Plot deposits
-            deposits = self.particle_tracker.deposit_model.deposits
-            positions = np.array([d.position for d in deposits if not d.removed])
-            if len(positions) > 0:
-                ax.scatter(
-                    positions[:, 0]/1000, positions[:, 1]/1000, positions[:, 2]/1000,
-                    color='red', s=50, alpha=0.8, label='Deposits'
-                )
-            
-            # Plot current trajectory
-            current_pos = trajectory_data[:frame+1]
-            if len(current_pos) > 0:
-                # Trajectory line
-                ax.plot(
-                    current_pos[:, 0], current_pos[:, 1], current_pos[:, 2],
-                    color='black', linewidth=2, label='Trajectory'
-                )
-                
-                # Current particle position
-                current_z = current_pos[-1, 2]
-                if current_z > grid_1_height:
-                    # Particle above grid
-                    ax.scatter(
-                        current_pos[-1, 0], current_pos[-1, 1], current_pos[-1, 2],
-                        color='green', s=100, label='Particle'
-                    )
+                    particle._offsets3d = ([pos[0]], [pos[1]], [pos[2]])
+                    impact._offsets3d = hidden
+                    if detailed:
+                        wave_line.set_data_3d([], [], [])
+                        # Direction arrow on the persistent collection.
+                        # Trajectory rows may carry velocity columns too,
+                        # so keep only the xyz components for the vector
+                        # math here.
+                        if len(current_pos) > 1:
+                            p = pos[:3]
+                            direction = p - current_pos[-2][:3]
+                            norm = np.linalg.norm(direction)
+                            if norm > 0:
+                                d = direction / norm * 0.1
+                                tip = p + d
+                                # Head barbs in a plane through the shaft
+                                perp = np.cross(d, [0.0, 0.0, 1.0])
+                                pnorm = np.linalg.norm(perp)
+                                if pnorm < 1e-12:
+                                    perp = np.cross(d, [1.0, 0.0, 0.0])
+                                    pnorm = np.linalg.norm(perp)
+                                perp = perp / pnorm * 0.02
+                                back = tip - 0.3 * d
+                                arrow.set_segments([
+                                    [p, tip],
+                                    [tip, back + perp],
+                                    [tip, back - perp],
+                                ])
+                            else:
+                                arrow.set_segments([])
+                        else:
+                            arrow.set_segments([])
                 else:
                     # Particle at grid - show impact
-                    ax.scatter(
-                        current_pos[-1, 0], current_pos[-1, 1], grid_1_height,
-                        color='yellow', s=150, marker='*', label='Impact'
-                    )
-            
-            # Set labels and limits
-            ax.set_xlabel('X (m)')
-            ax.set_ylabel('Y (m)')
-            ax.set_zlabel('Z (m)')
-            ax.set_title('FCC Chamber Cleaning Simulation')
-            
-            # Set view limits
-            ax.set_xlim(-r*1.2, r*1.2)
-            ax.set_ylim(-r*1.2, r*1.2)
-            ax.set_zlim(0, h)
-            
-            # Rotate view
-            ax.view_init(elev=20, azim=frame % 360)
-            
-            # Add legend
-            ax.legend()
-            
-            return ax,
-        
+                    particle._offsets3d = hidden
+                    impact._offsets3d = ([pos[0]], [pos[1]],
+                                         [grid_1_height])
+                    if detailed:
+                        arrow.set_segments([])
+                        # Impact waves: scale + translate the template
+                        wave_r = 0.1 * (frame % 20) / 20
+                        wave_line.set_data_3d(
+                            pos[0] + wave_r * self._unit_circle[:, 0],
+                            pos[1] + wave_r * self._unit_circle[:, 1],
+                            wave_z)
+
+            if detailed:
+                # Rotate view for better perspective
+                ax.view_init(elev=20, azim=45 + frame/2)
+
+                # Update effectiveness meter
+                if len(self.particle_tracker.impacts) > 0:
+                    effectiveness = removed_mask.mean() * 100
+                    effectiveness_text.set_text(
+                        f'Cleaning Effectiveness: {effectiveness:.1f}%')
+                return ax,
+
+            return traj_line, particle, impact, deposit_scatter
+
         anim = animation.FuncAnimation(
             fig,
             update,
-            init_func=init,
-            frames=len(trajectory_data),
+            frames=frame_indices,
             interval=interval,
-            blit=False,
+            blit=not detailed,
             repeat=True
         )
-        
-        plt.show()
+
+        if show:
+            plt.show()
         return anim
 
-    def save_animation(self, trajectory_data, filename, fps=20):
-        """Save animation to file with progress bar"""
+    def animate_trajectory_vispy(self, trajectory_data, interval=1/60):
+        """GPU-rendered live animation using VisPy scene visuals.
+
+        Builds the chamber wall as a Mesh, the grid rings as segment
+        Lines and the deposits/particle as Markers once, then a timer
+        only pushes changed vertex buffers via set_data each tick —
+        no per-frame artist creation or software rasterization.
+
+        Falls back to the matplotlib animation when VisPy (or a usable
+        GL backend) is unavailable.
+        """
+        if not VISPY_AVAILABLE:
+            print("VisPy not available, falling back to matplotlib animation")
+            return self.animate_trajectory(trajectory_data)
+
+        trajectory_data = np.ascontiguousarray(trajectory_data, dtype=np.float32)
+        r, h = self._r, self._h
+        n = len(self._theta)
+
+        try:
+            canvas = vispy_scene.SceneCanvas(keys='interactive',
+                                             bgcolor='white', show=True)
+        except RuntimeError as e:
+            print(f"VisPy backend unavailable ({e}), "
+                  "falling back to matplotlib animation")
+            return self.animate_trajectory(trajectory_data)
+
+        view = canvas.central_widget.add_view()
+        view.camera = 'turntable'
+        view.camera.set_range(x=(-r*1.2, r*1.2), y=(-r*1.2, r*1.2), z=(0, h))
+
+        # Chamber wall as an open cylinder mesh (two vertex rings)
+        ring = np.column_stack([self._ring_x, self._ring_y, np.zeros(n)])
+        wall_verts = np.vstack([ring, ring + [0, 0, h]]).astype(np.float32)
+        quads = np.arange(n - 1)
+        wall_faces = np.concatenate([
+            np.column_stack([quads, quads + 1, quads + n]),
+            np.column_stack([quads + 1, quads + n + 1, quads + n]),
+        ]).astype(np.uint32)
+        vispy_scene.visuals.Mesh(vertices=wall_verts, faces=wall_faces,
+                                 color=(0.5, 0.5, 0.5, 0.1), parent=view.scene)
+
+        # Grid rings as one segment batch
+        segments = []
+        for z_grid in self._grid_z:
+            ring_z = ring + [0, 0, z_grid]
+            segments.append(
+                np.repeat(ring_z, 2, axis=0)[1:-1].reshape(-1, 2, 3))
+        vispy_scene.visuals.Line(
+            pos=np.concatenate(segments).reshape(-1, 3),
+            connect='segments', color='blue', parent=view.scene)
+
+        deposits_vis = vispy_scene.visuals.Markers(parent=view.scene)
+        traj_vis = vispy_scene.visuals.Line(color='black', method='gl',
+                                            parent=view.scene)
+        particle_vis = vispy_scene.visuals.Markers(parent=view.scene)
+
+        state = {'frame': 0, 'deposit_version': -1}
+
+        def on_timer(event):
+            frame = state['frame']
+
+            # Deposit buffer only re-uploads when the model changed
+            cache = self._deposit_arrays()
+            if cache['version'] != state['deposit_version']:
+                mask = ~cache['removed_mask']
+                if mask.any():
+                    deposits_vis.set_data(
+                        pos=np.column_stack([cache['x'][mask],
+                                             cache['y'][mask],
+                                             cache['z'][mask]]),
+                        face_color='red', size=8)
+                state['deposit_version'] = cache['version']
+
+            traj_vis.set_data(pos=trajectory_data[:frame+1])
+            particle_vis.set_data(pos=trajectory_data[frame:frame+1],
+                                  face_color='green', size=12)
+
+            state['frame'] = (frame + 1) % len(trajectory_data)
+            canvas.update()
+
+        timer = vispy_app.Timer(interval=interval, connect=on_timer,
+                                start=True)
+        # Keep references alive for the caller
+        canvas._fcc_timer = timer
+        vispy_app.run()
+        return canvas
+
+    def save_animation(self, trajectory_data, filename, fps=20, disp_skip=1):
+        """Save animation to file with progress bar.
+
+        Encodes H.264/MP4 through ffmpeg when it is on PATH (fast,
+        multithreaded, ~10-50x smaller files) and falls back to the
+        pure-Python GIF writer otherwise. disp_skip is forwarded to
+        animate_trajectory for every-k-th-sample rendering.
+        """
         try:
             from tqdm import tqdm
+
+            # Create animation; show=False so the frames are only
+            # rendered once, by the file writer
+            anim = self.animate_trajectory(trajectory_data,
+                                           disp_skip=disp_skip,
+                                           show=False)
+
+            # Create writer: prefer ffmpeg, fall back to Pillow GIFs
+            stem, _ = os.path.splitext(filename)
+            if shutil.which('ffmpeg'):
+                filename = f'{stem}.mp4'
+                writer = animation.FFMpegWriter(
+                    fps=fps, codec='libx264', bitrate=4000,
+                    extra_args=['-preset', 'veryfast',
+                                '-pix_fmt', 'yuv420p'])
+            else:
+                filename = f'{stem}.gif'
+                writer = animation.PillowWriter(fps=fps)
+
             print(f"Saving animation to {filename}...")
-            
-            # Create animation
-            anim = self.animate_trajectory(trajectory_data)
-            
-            # Create writer
-            writer = animation.PillowWriter(fps=fps)
-            
-            # Save animation with progress bar
+
+            # Save animation with progress bar; a lower DPI on the save
+            # path keeps encode time down without touching the live view
             with tqdm(total=100, desc="Saving animation") as pbar:
                 anim.save(
                     f'output/{filename}',
                     writer=writer,
+                    dpi=100,
                     progress_callback=lambda i, n: pbar.update(100/n)
                 )
-            
+
             print(f"Animation saved successfully to output/{filename}")
-            
+
         except Exception as e:
             print(f"Error saving animation: {e}")